@@ -1,7 +1,9 @@
 import tkinter as tk
-import math
+from math import cos, sin, hypot, tau
 import random
 import time
+import textwrap
+from collections import deque
 
 # --- Configuration Constants ---
 # We use this as a consistent virtual base for coordinates (0-600)
@@ -28,10 +30,24 @@ class Aircraft:
         self.dest_y = y
         self.speed = speed
         self.color = color
-        self.trail = [] 
+        self.trail = deque(maxlen=5) # Recent VIRTUAL positions, oldest first
+
+        # Persistent canvas item IDs, created once by RadarApp._create_plane_items
+        self.dot_id = None
+        self.dest_id = None
+        self.label_id = None # Code and coordinates share one multiline text item
+        self.trail_ids = []
+        self.trail_colors = () # Faded fill of each trail dot, fixed for the plane's color
+        self._shown_trail = 0 # Number of trail dots currently in the 'normal' state
+
+        # Last integer coordinates shown in the label, so unchanged text is not re-sent to Tk
+        self._last_ix = None
+        self._last_iy = None
 
 # --- Radar Application Class ---
 class RadarApp(tk.Tk):
+    _TWOPI = tau # Full sweep revolution, in radians
+
     def __init__(self):
         super().__init__()
         self.title("WWII Ground Control Intercept (GCI) Radar")
@@ -42,12 +58,23 @@ class RadarApp(tk.Tk):
         self.is_fullscreen = False
         self.sweep_angle = 0
         self.planes = []
-        self.previous_radar_size = VIRTUAL_SCOPE_MAX 
+        self._planes_by_code = {} # Aircraft code -> Aircraft, for command lookups
+        self._tags = set() # Console log tags already configured
+        self._fade_cache = {} # (color, trail index) -> faded hex color
+        self._resize_after = None # Pending debounced resize callback
+        self._grid_ids = {} # Persistent static_grid item IDs, keyed by element
+        self._grid_size = None # RADAR_SIZE the static grid was last laid out for
+        self._frame_interval = 1 / 30 # Target frame time in seconds
+        self._next_tick = time.perf_counter()
+        self._paused = False # True while the window is minimized/hidden
 
         self.setup_ui()
         
+        # Let the geometry manager size the canvas first; otherwise winfo_width() reports 1
+        self.update_idletasks()
         self.update_radar_dimensions()
         self.initialize_planes() 
+        self._step_all = self._gen_step_all(len(self.planes))
         
         # --- DYNAMIC RESIZE BINDING ---
         self.bind('<Configure>', self.on_resize)
@@ -56,8 +83,15 @@ class RadarApp(tk.Tk):
         self.bind('<F11>', self.toggle_fullscreen)
         self.bind('<Escape>', self.exit_fullscreen)
         
+        # --- VISIBILITY BINDING (pause rendering while minimized) ---
+        self.bind('<Unmap>', self.on_unmap)
+        self.bind('<Map>', self.on_map)
+        
         # Initial draw and start animation
         self.draw_radar()
+        self.sweep_id = self.radar_canvas.create_line(
+            self.CENTER, self.CENTER, self.CENTER, self.CENTER, fill=COLOR_GLOW, width=3, tags="sweep_line"
+        )
         self.animate()
         
         self.log_to_console("SYSTEM: Radar powered up. Scanning initiated.", "SYSTEM")
@@ -68,36 +102,43 @@ class RadarApp(tk.Tk):
     # ---------------------------
 
     def update_radar_dimensions(self):
-        """Updates internal dimensions based on current canvas size."""
+        """
+        Updates internal dimensions based on current canvas size.
+        Only called on resize/fullscreen changes, so the values are cached between frames.
+        """
         self.RADAR_SIZE = self.radar_canvas.winfo_width() 
         self.CENTER = self.RADAR_SIZE / 2
         self.SCOPE_RADIUS = self.RADAR_SIZE * SCOPE_RADIUS_FACTOR
+        self._scale_factor = self.RADAR_SIZE / VIRTUAL_SCOPE_MAX
 
 
     def on_resize(self, event=None):
-        """Redraws and scales coordinates when the window is resized."""
+        """
+        Schedules a redraw when the window is resized.
+        Window managers fire many <Configure> events per drag, so they are coalesced
+        into a single _do_resize() call 50 ms after the last one.
+        """
         if event and event.widget != self.radar_canvas and event.widget != self:
              return
         
-        old_size = self.previous_radar_size
-        self.update_radar_dimensions()
-        new_size = self.RADAR_SIZE
+        if self._resize_after:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(50, self._do_resize)
 
-        scale_factor = new_size / old_size
-        
-        # --- CRITICAL FIX: SCALE PLANE COORDINATES ---
-        if scale_factor != 1:
-            for plane in self.planes:
-                plane.x *= scale_factor
-                plane.y *= scale_factor
-                plane.dest_x *= scale_factor
-                plane.dest_y *= scale_factor
-                plane.trail = [] 
 
-        self.previous_radar_size = new_size 
+    def _do_resize(self):
+        """
+        Redraws the scope for the new window size.
+        Plane positions and trails stay in VIRTUAL coordinates and are scaled at draw time,
+        so only the cached dimensions and the grid need updating here.
+        """
+        self._resize_after = None
+        
+        self.update_radar_dimensions()
 
-        self.radar_canvas.delete("static_grid") 
-        self.draw_radar() 
+        # Moving the window also fires <Configure>; only relayout on a real size change
+        if self.RADAR_SIZE != self._grid_size:
+            self.draw_radar() 
         
     # --- FULLSCREEN METHODS ---
     def toggle_fullscreen(self, event=None):
@@ -115,6 +156,17 @@ class RadarApp(tk.Tk):
             self.attributes('-fullscreen', False)
         self.on_resize()
         return "break"
+
+    # --- VISIBILITY METHODS ---
+    def on_unmap(self, event):
+        """Pauses rendering when the main window is minimized or hidden."""
+        if event.widget == self:
+            self._paused = True
+
+    def on_map(self, event):
+        """Resumes rendering when the main window is shown again."""
+        if event.widget == self:
+            self._paused = False
     # ---------------------------
 
 
@@ -174,20 +226,51 @@ class RadarApp(tk.Tk):
         VIRTUAL_CENTER = VIRTUAL_SCOPE_MAX / 2
         VIRTUAL_RADIUS = VIRTUAL_SCOPE_MAX * SCOPE_RADIUS_FACTOR
 
+        # Trail length and palette are fixed, so every faded trail color can be computed up front
+        for color in colors:
+            for i in range(6):
+                self._fade_cache[(color, i)] = self.fade_color(color, i / 6)
+
         for i, code in enumerate(codes):
             # Place planes randomly within 70% of the virtual radius
             r = random.uniform(0, VIRTUAL_RADIUS * 0.7)
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.uniform(0, tau)
             
             # Start position in the virtual (0-600) coordinate system
-            x = VIRTUAL_CENTER + r * math.cos(angle)
-            y = VIRTUAL_CENTER + r * math.sin(angle)
+            x = VIRTUAL_CENTER + r * cos(angle)
+            y = VIRTUAL_CENTER + r * sin(angle)
             
             speed = PLANE_BASE_SPEED + random.random() * 0.15 
             
             plane = Aircraft(code, x, y, speed, colors[i % len(colors)])
             self.planes.append(plane)
+            self._planes_by_code[code] = plane
             self.set_new_random_destination(plane)
+            self._create_plane_items(plane)
+
+
+    def _create_plane_items(self, plane):
+        """Creates the canvas items for a plane once; animate() only moves them afterwards."""
+        # Trail dots are created first so they sit underneath the plane dot; their fill never changes
+        plane.trail_colors = tuple(self._fade_cache[(plane.color, i)] for i in range(5))
+        plane.trail_ids = [
+            self.radar_canvas.create_oval(0, 0, 0, 0, fill=trail_color, outline='', state='hidden', tags="plane_data")
+            for trail_color in plane.trail_colors
+        ]
+
+        plane.dot_id = self.radar_canvas.create_oval(
+            0, 0, 0, 0, fill=plane.color, outline=COLOR_GLOW, width=1, tags="plane_data"
+        )
+
+        # Destination marker as a single '+' glyph rather than two crossed lines
+        plane.dest_id = self.radar_canvas.create_text(
+            0, 0, text='+', fill=COLOR_DIM, font=("Courier", 10), tags="plane_data"
+        )
+
+        plane.label_id = self.radar_canvas.create_text(
+            0, 0, text=plane.code, fill=plane.color, 
+            font=("Courier", 8), anchor=tk.N, tags="plane_data"
+        )
 
 
     def set_new_random_destination(self, plane):
@@ -196,10 +279,10 @@ class RadarApp(tk.Tk):
         VIRTUAL_RADIUS = VIRTUAL_SCOPE_MAX * SCOPE_RADIUS_FACTOR
         
         r = random.uniform(VIRTUAL_RADIUS * 0.2, VIRTUAL_RADIUS)
-        angle = random.uniform(0, 2 * math.pi)
+        angle = random.uniform(0, tau)
         
-        plane.dest_x = VIRTUAL_CENTER + r * math.cos(angle)
-        plane.dest_y = VIRTUAL_CENTER + r * math.sin(angle)
+        plane.dest_x = VIRTUAL_CENTER + r * cos(angle)
+        plane.dest_y = VIRTUAL_CENTER + r * sin(angle)
 
 
     def log_to_console(self, message, source="SYSTEM"):
@@ -210,7 +293,7 @@ class RadarApp(tk.Tk):
         
         tag = source.lower()
         
-        if tag not in self.console_log.tag_names():
+        if tag not in self._tags:
             if source == "COMMAND":
                 color = '#FFFF00' 
             elif source == "PILOT":
@@ -219,6 +302,7 @@ class RadarApp(tk.Tk):
                 color = COLOR_GLOW 
             self.console_log.tag_config(tag, foreground=color)
             self.console_log.tag_config('dim_time', foreground=COLOR_DIM)
+            self._tags.add(tag)
 
         self.console_log.insert(tk.END, f"{timestamp} ", 'dim_time')
         self.console_log.insert(tk.END, f"{source}: ", tag)
@@ -266,7 +350,7 @@ class RadarApp(tk.Tk):
             self.log_to_console(error_msg, "SYSTEM")
             return
 
-        plane = next((p for p in self.planes if p.code == code), None)
+        plane = self._planes_by_code.get(code)
 
         if not plane:
             self.log_to_console(f"ERROR: Aircraft code {code} not found.", "SYSTEM")
@@ -285,79 +369,98 @@ class RadarApp(tk.Tk):
         self.log_to_console(f"ACFT {plane.code}: Roger, turning to intercept coordinates X={int(new_x)}, Y={int(new_y)}. Tally ho!", "PILOT")
 
 
-    def distance(self, x1, y1, x2, y2):
-        """Calculates Euclidean distance."""
-        return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-
-
     def get_scaled_position(self, plane):
         """Returns the plane's position scaled to the CURRENT canvas size."""
-        scale_factor = self.RADAR_SIZE / VIRTUAL_SCOPE_MAX
-        
-        scaled_x = plane.x * scale_factor
-        scaled_y = plane.y * scale_factor
-        scaled_dest_x = plane.dest_x * scale_factor
-        scaled_dest_y = plane.dest_y * scale_factor
-        
-        return scaled_x, scaled_y, scaled_dest_x, scaled_dest_y
-
+        sf = self._scale_factor
+        return plane.x * sf, plane.y * sf, plane.dest_x * sf, plane.dest_y * sf
 
-    def move_plane(self, plane):
-        """Updates the position of a single plane using VIRTUAL coordinates."""
-        
-        # Calculate distance and direction based on VIRTUAL coordinates (0-600)
-        dist = self.distance(plane.x, plane.y, plane.dest_x, plane.dest_y)
 
-        if dist > plane.speed:
-            dx = plane.dest_x - plane.x
-            dy = plane.dest_y - plane.y
-
-            factor = plane.speed / dist
-            
-            # Update virtual position
-            plane.x += dx * factor
-            plane.y += dy * factor
-            
-            # Update trail with scaled coordinates for drawing
-            scaled_x, scaled_y, _, _ = self.get_scaled_position(plane)
-            plane.trail.append((scaled_x, scaled_y))
-            if len(plane.trail) > 5: 
-                plane.trail.pop(0)
-
-        elif dist > 1: # Close enough to destination
-            plane.x = plane.dest_x
-            plane.y = plane.dest_y
-            self.log_to_console(f"ACFT {plane.code}: I'm at the target area. Awaiting new orders.", "PILOT")
-            self.set_new_random_destination(plane)
-            plane.trail = [] 
+    def _gen_step_all(self, count):
+        """
+        Generates a step function that advances exactly `count` planes by one frame,
+        using VIRTUAL coordinates. The per-plane update is unrolled so the frame loop
+        has no list iteration; the roster is fixed once initialize_planes() has run.
+        """
+        plane_names = [f"p{i}" for i in range(count)]
+        
+        # Unpacking also checks that the roster still has exactly `count` planes
+        source = "def step_all(planes, arrive):\n"
+        source += f"    ({''.join(name + ', ' for name in plane_names)}) = planes\n"
+        
+        for name in plane_names:
+            # Same update for every plane: distance/direction in VIRTUAL coordinates (0-600),
+            # step towards the destination and record the trail point, or hand off on arrival
+            source += textwrap.indent(textwrap.dedent(f"""\
+                x = {name}.x
+                y = {name}.y
+                dx = {name}.dest_x - x
+                dy = {name}.dest_y - y
+                dist = hypot(dx, dy)
+                if dist > {name}.speed:
+                    factor = {name}.speed / dist
+                    x += dx * factor
+                    y += dy * factor
+                    {name}.x = x
+                    {name}.y = y
+                    {name}.trail.append((x, y))
+                elif dist > 1:
+                    arrive({name})
+                """), "    ")
+        
+        namespace = {"hypot": hypot}
+        exec(compile(source, f"<step_all:{count}>", "exec"), namespace)
+        return namespace["step_all"]
+
+
+    def _plane_arrived(self, plane):
+        """Snaps a plane onto its destination and gives it a new one."""
+        plane.x = plane.dest_x
+        plane.y = plane.dest_y
+        self.log_to_console(f"ACFT {plane.code}: I'm at the target area. Awaiting new orders.", "PILOT")
+        self.set_new_random_destination(plane)
+        plane.trail.clear()
+
+
+    def _place_grid_item(self, key, kind, *coords, **options):
+        """Creates a static_grid item on first use; afterwards only moves it to the new coords."""
+        item_id = self._grid_ids.get(key)
+        if item_id is None:
+            create = getattr(self.radar_canvas, "create_" + kind)
+            self._grid_ids[key] = create(*coords, tags="static_grid", **options)
+        else:
+            self.radar_canvas.coords(item_id, *coords)
 
 
     def draw_radar(self):
         """
         Draws the static radar elements using dynamic canvas sizes.
+        The items persist for the life of the canvas; later calls only reposition them.
         UPDATED to add 'X' and 'Y' labels to the coordinate grid.
         """
+        self._grid_size = self.RADAR_SIZE
         
         # 1. Main circle (Scope edge)
-        self.radar_canvas.create_oval(
+        self._place_grid_item(
+            "scope", "oval",
             self.CENTER - self.SCOPE_RADIUS, self.CENTER - self.SCOPE_RADIUS, 
             self.CENTER + self.SCOPE_RADIUS, self.CENTER + self.SCOPE_RADIUS, 
-            outline=COLOR_GLOW, width=2, tags="static_grid"
+            outline=COLOR_GLOW, width=2
         )
 
         # 2. Concentric Range Rings (Faded)
         ring_count = 3
         for i in range(1, ring_count + 1):
             r = (self.SCOPE_RADIUS / ring_count) * i
-            self.radar_canvas.create_oval(
+            self._place_grid_item(
+                ("ring", i), "oval",
                 self.CENTER - r, self.CENTER - r, 
                 self.CENTER + r, self.CENTER + r, 
-                outline=COLOR_DIM, width=1, dash=(3, 3), tags="static_grid"
+                outline=COLOR_DIM, width=1, dash=(3, 3)
             )
 
         # 3. Crosshairs (Faded)
-        self.radar_canvas.create_line(0, self.CENTER, self.RADAR_SIZE, self.CENTER, fill=COLOR_DIM, width=1, tags="static_grid")
-        self.radar_canvas.create_line(self.CENTER, 0, self.CENTER, self.RADAR_SIZE, fill=COLOR_DIM, width=1, tags="static_grid")
+        self._place_grid_item("cross_h", "line", 0, self.CENTER, self.RADAR_SIZE, self.CENTER, fill=COLOR_DIM, width=1)
+        self._place_grid_item("cross_v", "line", self.CENTER, 0, self.CENTER, self.RADAR_SIZE, fill=COLOR_DIM, width=1)
 
         # 4. Add Coordinate Markers and Labels
         tick_count = 6 
@@ -369,89 +472,92 @@ class RadarApp(tk.Tk):
             pos = i * visual_interval
             
             # --- X-Axis Ticks and Labels (Bottom) ---
-            self.radar_canvas.create_line(pos, self.CENTER - 4, pos, self.CENTER + 4, fill=COLOR_GLOW, width=1, tags="static_grid")
+            self._place_grid_item(("x_tick", i), "line", pos, self.CENTER - 4, pos, self.CENTER + 4, fill=COLOR_GLOW, width=1)
             
             if i < tick_count: 
                  # Added ' X' label
-                 self.radar_canvas.create_text(
+                 self._place_grid_item(
+                    ("x_label", i), "text",
                     pos, self.RADAR_SIZE - 15, text=f"{coord_value} X", fill=COLOR_GLOW, 
-                    font=("Courier", 8), anchor=tk.N, tags="static_grid"
+                    font=("Courier", 8), anchor=tk.N
                 )
             
             # --- Y-Axis Ticks and Labels (Left) ---
-            self.radar_canvas.create_line(self.CENTER - 4, pos, self.CENTER + 4, pos, fill=COLOR_GLOW, width=1, tags="static_grid")
+            self._place_grid_item(("y_tick", i), "line", self.CENTER - 4, pos, self.CENTER + 4, pos, fill=COLOR_GLOW, width=1)
 
             if i != 0 and i <= tick_count: 
                 # Added ' Y' label and adjusted position slightly right
-                self.radar_canvas.create_text(
+                self._place_grid_item(
+                    ("y_label", i), "text",
                     8, pos, text=f"{coord_value} Y", fill=COLOR_GLOW, 
-                    font=("Courier", 8), anchor=tk.W, tags="static_grid"
+                    font=("Courier", 8), anchor=tk.W
                 )
                 
         # Special case for the 600 X-coordinate label at the far right
         # Added ' X' label and adjusted position slightly left
-        self.radar_canvas.create_text(
+        self._place_grid_item(
+            "x_label_max", "text",
             self.RADAR_SIZE - 25, self.RADAR_SIZE - 15, text="600 X", fill=COLOR_GLOW, 
-            font=("Courier", 8), anchor=tk.N, tags="static_grid"
+            font=("Courier", 8), anchor=tk.N
         )
 
+        # Keep the grid on the lowest layer, beneath the plane items and sweep line
+        self.radar_canvas.tag_lower("static_grid")
+
 
     def draw_sweep(self):
-        """Draws the rotating sweep line."""
+        """Moves the persistent sweep line to the current angle."""
         
-        x2 = self.CENTER + math.cos(self.sweep_angle) * self.SCOPE_RADIUS
-        y2 = self.CENTER + math.sin(self.sweep_angle) * self.SCOPE_RADIUS
+        x2 = self.CENTER + cos(self.sweep_angle) * self.SCOPE_RADIUS
+        y2 = self.CENTER + sin(self.sweep_angle) * self.SCOPE_RADIUS
         
-        self.radar_canvas.create_line(self.CENTER, self.CENTER, x2, y2, fill=COLOR_GLOW, width=3, tags="sweep_line")
+        self.radar_canvas.coords(self.sweep_id, self.CENTER, self.CENTER, x2, y2)
         
         self.sweep_angle += SWEEP_SPEED
-        if self.sweep_angle > 2 * math.pi:
-            self.sweep_angle -= 2 * math.pi
+        if self.sweep_angle > self._TWOPI:
+            self.sweep_angle -= self._TWOPI
 
 
-    def draw_planes(self):
-        """Draws the aircraft, trails, and labels, using scaled coordinates."""
+    def update_plane_items(self):
+        """Moves the aircraft, trails, and labels to their current scaled coordinates."""
+        canvas = self.radar_canvas
+        sf = self._scale_factor
         
         for plane in self.planes:
             # Get the current scaled coordinates for drawing
             scaled_x, scaled_y, scaled_dest_x, scaled_dest_y = self.get_scaled_position(plane)
             
-            # Draw trail (uses already scaled coordinates saved in move_plane)
-            for i, (tx, ty) in enumerate(plane.trail):
-                alpha = i / (len(plane.trail) + 1)
-                trail_color = self.fade_color(plane.color, alpha)
-                self.radar_canvas.create_oval(
-                    tx - 1, ty - 1, tx + 1, ty + 1, fill=trail_color, outline='', tags="plane_data"
-                )
-
-            # Draw the plane dot (the primary return)
-            self.radar_canvas.create_oval(
+            # Trail (virtual coordinates, scaled here so it survives resizes); unused dots stay hidden
+            trail = plane.trail
+            trail_ids = plane.trail_ids
+            for trail_id, (tx, ty) in zip(trail_ids, trail):
+                tx *= sf
+                ty *= sf
+                canvas.coords(trail_id, tx - 1, ty - 1, tx + 1, ty + 1)
+
+            # Only touch item state when the number of visible dots changes
+            shown = len(trail)
+            if shown != plane._shown_trail:
+                for i in range(min(shown, plane._shown_trail), max(shown, plane._shown_trail)):
+                    canvas.itemconfigure(trail_ids[i], state='normal' if i < shown else 'hidden')
+                plane._shown_trail = shown
+
+            # The plane dot (the primary return)
+            canvas.coords(
+                plane.dot_id,
                 scaled_x - PLANE_SIZE/2, scaled_y - PLANE_SIZE/2, 
-                scaled_x + PLANE_SIZE/2, scaled_y + PLANE_SIZE/2, 
-                fill=plane.color, outline=COLOR_GLOW, width=1, 
-                tags="plane_data"
+                scaled_x + PLANE_SIZE/2, scaled_y + PLANE_SIZE/2
             )
 
-            # Draw the destination marker (dim cross)
-            self.radar_canvas.create_line(
-                scaled_dest_x - 5, scaled_dest_y, scaled_dest_x + 5, scaled_dest_y, fill=COLOR_DIM, tags="plane_data"
-            )
-            self.radar_canvas.create_line(
-                scaled_dest_x, scaled_dest_y - 5, scaled_dest_x, scaled_dest_y + 5, fill=COLOR_DIM, tags="plane_data"
-            )
+            # The destination marker (dim cross)
+            canvas.coords(plane.dest_id, scaled_dest_x, scaled_dest_y)
 
-            # Draw the plane code label (just below the dot)
-            self.radar_canvas.create_text(
-                scaled_x, scaled_y + 10, text=plane.code, fill=plane.color, 
-                font=("Courier", 8), tags="plane_data"
-            )
-            
-            # Draw X, Y coordinates for the aircraft
-            coords_text = f"X={int(plane.x)}, Y={int(plane.y)}"
-            self.radar_canvas.create_text(
-                scaled_x, scaled_y + 20, text=coords_text, fill=COLOR_DIM, 
-                font=("Courier", 7), tags="plane_data"
-            )
+            # The plane code and X, Y coordinates label (just below the dot)
+            canvas.coords(plane.label_id, scaled_x, scaled_y + 5)
+            ix, iy = int(plane.x), int(plane.y)
+            if ix != plane._last_ix or iy != plane._last_iy:
+                canvas.itemconfigure(plane.label_id, text=f"{plane.code}\nX={ix}, Y={iy}")
+                plane._last_ix, plane._last_iy = ix, iy
 
     def fade_color(self, hex_color, alpha):
         """A simplified way to make a color appear faded by blending towards black."""
@@ -474,18 +580,24 @@ class RadarApp(tk.Tk):
     def animate(self):
         """The main animation loop."""
         
-        self.radar_canvas.delete("plane_data") 
-        self.radar_canvas.delete("sweep_line") 
-        
-        self.update_radar_dimensions() 
+        if self._paused:
+            # Nothing is visible; poll slowly and restart the frame clock on resume
+            self._next_tick = time.perf_counter()
+            self.after(250, self.animate)
+            return
         
-        for plane in self.planes:
-            self.move_plane(plane)
-            
-        self.draw_planes()
+        self._step_all(self.planes, self._plane_arrived)
+        self.update_plane_items()
         self.draw_sweep()
         
-        self.after(33, self.animate)
+        # Schedule against a monotonic deadline so per-frame work doesn't stretch the frame time
+        now = time.perf_counter()
+        self._next_tick += self._frame_interval
+        if self._next_tick < now - self._frame_interval:
+            # Fell more than a frame behind (e.g. a stall); resync instead of bursting to catch up
+            self._next_tick = now
+        delay = max(1, int((self._next_tick - now) * 1000))
+        self.after(delay, self.animate)
 
 
 # --- Initial Setup ---